@@ -0,0 +1,154 @@
+"""
+Tests for the TinyBase CLI.
+"""
+
+import os
+import sys
+
+import pytest
+
+
+def run_cli(monkeypatch, *args: str) -> int:
+    """Run the CLI entry point with the given arguments and return the exit code."""
+    from tinybase.cli import main
+
+    monkeypatch.setattr(sys, "argv", ["tinybase", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    return exc_info.value.code
+
+
+@pytest.fixture
+def isolated_root(monkeypatch, tmp_path):
+    """Resolve settings and the database against tmp_path, ignoring state from other tests."""
+    from tinybase.db.core import reset_engine
+
+    monkeypatch.delenv("TINYBASE_DB_URL", raising=False)
+    monkeypatch.setenv("TINYBASE_ROOT", str(tmp_path))
+    # Restored by monkeypatch, so later tests get back the settings they had
+    monkeypatch.setattr("tinybase.config._settings", None)
+    reset_engine()
+    yield tmp_path
+    reset_engine()
+
+
+def test_version_skips_subcommand_groups(monkeypatch, capsys):
+    """Test that core commands don't import subcommand group modules."""
+    from tinybase.version import __version__
+
+    for module in ("tinybase.cli.db", "tinybase.cli.extensions"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+
+    assert run_cli(monkeypatch, "version") == 0
+    assert f"TinyBase v{__version__}" in capsys.readouterr().out
+    assert "tinybase.cli.db" not in sys.modules
+    assert "tinybase.cli.extensions" not in sys.modules
+
+
+def test_init_does_not_change_working_directory(monkeypatch, isolated_root):
+    """Test that init writes into the target directory without chdir."""
+    cwd = os.getcwd()
+    target = isolated_root / "project"
+
+    assert run_cli(monkeypatch, "init", str(target)) == 0
+
+    assert os.getcwd() == cwd
+    assert (target / "tinybase.toml").exists()
+    assert (target / "tinybase.db").exists()
+
+
+def test_init_ignores_already_loaded_settings(monkeypatch, isolated_root):
+    """Test that init uses the target directory even if settings were loaded before."""
+    from tinybase.config import settings
+    from tinybase.db.core import get_engine
+
+    settings()
+    get_engine()
+    target = isolated_root / "project"
+
+    assert run_cli(monkeypatch, "init", str(target)) == 0
+
+    assert (target / "tinybase.db").exists()
+    assert not (isolated_root / "tinybase.db").exists()
+
+
+def test_ensure_db_creates_tables_for_new_engine(monkeypatch, isolated_root):
+    """Test that ensure_db initializes the database again after the engine is reset."""
+    from sqlalchemy import inspect
+
+    from tinybase.cli.utils import ensure_db
+    from tinybase.config import reload_settings
+    from tinybase.db.core import reset_engine
+
+    for name in ("a.db", "b.db"):
+        monkeypatch.setenv("TINYBASE_DB_URL", f"sqlite:///{isolated_root / name}")
+        reload_settings()
+        reset_engine()
+
+        assert "user" in inspect(ensure_db()).get_table_names()
+
+
+def test_root_help_lists_subcommand_groups(monkeypatch, capsys):
+    """Test that root-level help loads and lists every subcommand group."""
+    from tinybase.cli import _SUBCOMMAND_GROUPS
+
+    assert run_cli(monkeypatch, "--help") == 0
+    out = capsys.readouterr().out
+    for name in _SUBCOMMAND_GROUPS:
+        assert name in out
+
+
+def test_admin_add_creates_then_updates_user(monkeypatch, capsys, isolated_root):
+    """Test that admin add inserts a new admin and updates an existing one in place."""
+    from sqlmodel import Session, select
+
+    from tinybase.auth import verify_password
+    from tinybase.cli.utils import ensure_db
+    from tinybase.db.models import User
+
+    assert run_cli(monkeypatch, "admin", "add", "admin@test.com", "first-password") == 0
+    assert "Created admin user: admin@test.com" in capsys.readouterr().out
+
+    with Session(ensure_db()) as session:
+        created_at = (
+            session.exec(select(User).where(User.email == "admin@test.com")).one().created_at
+        )
+
+    assert run_cli(monkeypatch, "admin", "add", "admin@test.com", "second-password") == 0
+    assert "Updated admin user: admin@test.com" in capsys.readouterr().out
+
+    assert run_cli(monkeypatch, "admin", "add", "other@test.com", "other-password") == 0
+    assert "Created admin user: other@test.com" in capsys.readouterr().out
+
+    with Session(ensure_db()) as session:
+        users = session.exec(select(User).where(User.email == "admin@test.com")).all()
+        assert len(users) == 1
+        assert users[0].is_admin
+        assert users[0].created_at == created_at
+        assert verify_password("second-password", users[0].password_hash)
+        assert not verify_password("first-password", users[0].password_hash)
+        assert len(session.exec(select(User)).all()) == 2
+
+
+def test_subcommand_group_is_dispatched_directly(monkeypatch, capsys):
+    """Test that the requested subcommand group is loaded and dispatched."""
+    assert run_cli(monkeypatch, "db", "--help") == 0
+    out = capsys.readouterr().out
+    assert "tinybase db" in out
+    assert "migrate" in out
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("hello", "Hello"),
+        ("add_numbers", "AddNumbers"),
+        ("fetch_url_v2", "FetchUrlV2"),
+        ("double__underscore_", "DoubleUnderscore"),
+    ],
+)
+def test_snake_to_camel(name, expected):
+    """Test snake_case to CamelCase conversion."""
+    from tinybase.cli.utils import snake_to_camel
+
+    assert snake_to_camel(name) == expected
@@ -0,0 +1,342 @@
+"""
+Tests for extension lifecycle hooks.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import types
+from uuid import uuid4
+
+import pytest
+
+from tinybase.extensions.hooks import (
+    RecordCreateEvent,
+    clear_hooks,
+    on_record_create,
+    on_shutdown,
+    on_startup,
+    on_startup_background,
+    run_record_create_hooks,
+    run_shutdown_hooks,
+    run_startup_hooks,
+)
+
+
+class Service:
+    """Extension-style object registering a bound method as a hook."""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def start(self):
+        self.calls.append(self.name)
+
+
+@pytest.fixture(autouse=True)
+def reset_hooks():
+    """Start and end each test with empty hook registries."""
+    clear_hooks()
+    yield
+    clear_hooks()
+
+
+async def test_startup_runs_sync_and_async_hooks():
+    """Test that sync and async startup hooks are both executed."""
+    calls = []
+
+    @on_startup
+    def sync_hook():
+        calls.append("sync")
+
+    @on_startup
+    async def async_hook():
+        await asyncio.sleep(0)
+        calls.append("async")
+
+    await run_startup_hooks()
+
+    assert sorted(calls) == ["async", "sync"]
+
+
+async def test_sync_startup_hooks_run_in_worker_thread():
+    """Test that sync hooks run off the event loop unless registered as non-blocking."""
+    threads = {}
+
+    @on_startup
+    def blocking_hook():
+        threads["blocking"] = threading.get_ident()
+
+    @on_startup(blocking=False)
+    def inline_hook():
+        threads["inline"] = threading.get_ident()
+
+    await run_startup_hooks()
+
+    assert threads["inline"] == threading.get_ident()
+    assert threads["blocking"] != threading.get_ident()
+
+
+async def test_failing_hook_does_not_stop_others(caplog):
+    """Test that an exception in one hook doesn't prevent the rest from running."""
+    calls = []
+
+    @on_shutdown
+    def broken_sync():
+        raise RuntimeError("boom")
+
+    @on_shutdown
+    async def broken_async():
+        raise RuntimeError("boom")
+
+    @on_shutdown
+    def sync_hook():
+        calls.append("sync")
+
+    @on_shutdown
+    async def async_hook():
+        calls.append("async")
+
+    await run_shutdown_hooks()
+
+    assert sorted(calls) == ["async", "sync"]
+    errors = {record.getMessage(): record for record in caplog.records}
+    assert errors["Error in shutdown hook broken_sync"].exc_info is not None
+    assert errors["Error in shutdown hook broken_async"].exc_info is not None
+
+
+async def test_failing_partial_hook_is_logged(caplog):
+    """Test that a failing hook without a __name__ is still logged."""
+
+    def broken(reason):
+        raise RuntimeError(reason)
+
+    hook = functools.partial(broken, "boom")
+    on_shutdown(hook, blocking=False)
+
+    await run_shutdown_hooks()
+
+    assert caplog.records[-1].getMessage() == f"Error in shutdown hook {hook!r}"
+
+
+async def test_clear_hooks():
+    """Test that cleared hooks are no longer executed."""
+    calls = []
+
+    @on_startup
+    def hook():
+        calls.append("hook")
+
+    clear_hooks()
+    await run_startup_hooks()
+
+    assert calls == []
+
+
+async def test_async_event_hooks_run_concurrently():
+    """Test that async event hooks are awaited concurrently, not one by one."""
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+    @on_record_create(collection="orders")
+    async def first(event):
+        first_started.set()
+        await second_started.wait()
+
+    @on_record_create(collection="orders")
+    async def second(event):
+        second_started.set()
+        await first_started.wait()
+
+    event = RecordCreateEvent(collection="orders", record_id=uuid4(), data={}, owner_id=None)
+    # Each hook waits for the other, so serial execution would never finish
+    await asyncio.wait_for(run_record_create_hooks(event), timeout=1)
+
+
+async def test_hook_registered_after_run_is_executed():
+    """Test that hooks registered after a run are picked up by the next run."""
+    calls = []
+
+    @on_startup(blocking=False)
+    def first():
+        calls.append("first")
+
+    await run_startup_hooks()
+
+    @on_startup(blocking=False)
+    def second():
+        calls.append("second")
+
+    await run_startup_hooks()
+
+    assert calls == ["first", "first", "second"]
+
+
+async def test_wrapped_async_hook_is_awaited():
+    """Test that async hooks behind a functools.wraps decorator are awaited."""
+    calls = []
+
+    def logged(func):
+        @functools.wraps(func)
+        def wrapper():
+            calls.append("wrapper")
+            return func()
+
+        return wrapper
+
+    @on_startup
+    @logged
+    async def hook():
+        calls.append("hook")
+
+    await run_startup_hooks()
+
+    assert calls == ["wrapper", "hook"]
+
+
+async def test_callable_with_async_call_is_awaited():
+    """Test that an object with an async __call__ method is run as an async hook."""
+    calls = []
+
+    class Hook:
+        async def __call__(self):
+            calls.append("callable")
+
+    on_startup(Hook())
+    await run_startup_hooks()
+
+    assert calls == ["callable"]
+
+
+async def test_awaitable_returned_by_sync_hook_is_awaited():
+    """Test that a sync hook returning a coroutine has it awaited, inline or threaded."""
+    calls = []
+
+    async def record(name):
+        calls.append(name)
+
+    on_startup(lambda: record("threaded"))
+    on_startup(lambda: record("inline"), blocking=False)
+    await run_startup_hooks()
+
+    assert sorted(calls) == ["inline", "threaded"]
+
+
+async def test_background_startup_hooks_do_not_block():
+    """Test that background startup hooks run without delaying startup."""
+    release = asyncio.Event()
+    calls = []
+
+    @on_startup_background
+    async def slow_hook():
+        await release.wait()
+        calls.append("async")
+
+    @on_startup_background
+    def sync_hook():
+        calls.append("sync")
+
+    # Returns although slow_hook is still waiting
+    await asyncio.wait_for(run_startup_hooks(), timeout=1)
+
+    release.set()
+    for _ in range(100):
+        if len(calls) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert sorted(calls) == ["async", "sync"]
+
+
+async def test_background_startup_hooks_cancelled_on_shutdown():
+    """Test that unfinished background startup hooks are cancelled at shutdown."""
+    cancelled = asyncio.Event()
+
+    @on_startup_background
+    async def never_finishes():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    await run_startup_hooks()
+    await asyncio.sleep(0)
+    await run_shutdown_hooks()
+
+    # Cancelled tasks are awaited before shutdown hooks return
+    assert cancelled.is_set()
+
+
+async def test_duplicate_hook_registration_runs_once():
+    """Test that registering the same hook twice doesn't run it twice."""
+    calls = []
+
+    def hook():
+        calls.append("hook")
+
+    on_startup(hook)
+    on_startup(hook)
+    await run_startup_hooks()
+
+    assert calls == ["hook"]
+
+
+async def test_bound_method_hooks_of_different_instances_all_run():
+    """Test that the same method bound to different instances is registered per instance."""
+    calls = []
+    a, b = Service("a", calls), Service("b", calls)
+    on_startup(a.start, blocking=False)
+    on_startup(b.start, blocking=False)
+    on_startup(a.start, blocking=False)
+
+    await run_startup_hooks()
+
+    assert sorted(calls) == ["a", "b"]
+
+
+async def test_reloaded_hook_replaces_previous_version(caplog):
+    """Test that re-importing an extension module keeps only its latest hooks."""
+    caplog.set_level(logging.INFO, logger="tinybase.extensions.hooks")
+    calls = []
+    source = (
+        "from tinybase.extensions.hooks import on_startup\n"
+        "\n"
+        "@on_startup(blocking=False)\n"
+        "def hook():\n"
+        "    calls.append(version)\n"
+    )
+
+    for version in (1, 2):
+        module = types.ModuleType("reloaded_extension")
+        module.calls = calls
+        module.version = version
+        exec(source, module.__dict__)
+
+    await run_startup_hooks()
+
+    assert calls == [2]
+    assert "Replacing hook hook with its reloaded version" in caplog.messages
+
+
+async def test_hooks_sharing_a_name_in_one_module_are_all_kept():
+    """Test that same-named hooks from one module execution are not deduplicated."""
+    calls = []
+    source = (
+        "from tinybase.extensions.hooks import on_startup\n"
+        "\n"
+        "for name in ('cache', 'metrics'):\n"
+        "    @on_startup(blocking=False)\n"
+        "    def hook(name=name):\n"
+        "        calls.append(name)\n"
+    )
+
+    module = types.ModuleType("looped_extension")
+    module.calls = calls
+    exec(source, module.__dict__)
+
+    await run_startup_hooks()
+
+    assert calls == ["cache", "metrics"]
@@ -132,7 +132,7 @@ def list_extensions(
     for ext in extensions:
         update_version = None
         if check_updates:
-            result = check_for_updates(session, ext.name)
+            result = check_for_updates(ext)
             if result:
                 _, update_version = result
         extension_infos.append(extension_to_response(ext, update_version))
@@ -195,7 +195,7 @@ def get_extension(
 
     update_version = None
     if check_updates:
-        result = check_for_updates(session, extension.name)
+        result = check_for_updates(extension)
         if result:
             _, update_version = result
 
@@ -4,27 +4,64 @@ TinyBase CLI application.
 Provides commands for:
 - init: Initialize a new TinyBase instance
 - serve: Start the TinyBase server
-- functions new: Create a new function boilerplate
-- functions deploy: Deploy functions to a remote server
 - admin add: Create or update an admin user
 - extensions install/uninstall/list/enable/disable: Manage extensions
+
+Subcommand groups are only imported when they are requested on the command
+line, so core commands like `tinybase version` and `tinybase serve` don't pay
+for loading the other command modules, and `tinybase <group> <command>` is
+dispatched to the group's app with a single dict lookup.
 """
 
-from .admin import admin_app
-from .db import db_app
-from .extensions import extensions_app
-from .functions import functions_app
+import sys
+from importlib import import_module
+
+import typer
+
 from .main import app
 
-# Register subcommand groups
-app.add_typer(functions_app, name="functions")
-app.add_typer(db_app, name="db")
-app.add_typer(admin_app, name="admin")
-app.add_typer(extensions_app, name="extensions")
+# Subcommand groups: group name -> (module, Typer app attribute).
+# A new group module is only reachable once it is listed here.
+_SUBCOMMAND_GROUPS: dict[str, tuple[str, str]] = {
+    "db": (".db", "db_app"),
+    "admin": (".admin", "admin_app"),
+    "extensions": (".extensions", "extensions_app"),
+}
+
+
+def _load_group(name: str) -> typer.Typer:
+    """Import and return the Typer app for a subcommand group."""
+    module_name, attr = _SUBCOMMAND_GROUPS[name]
+    return getattr(import_module(module_name, __name__), attr)
+
+
+def _register_group(name: str) -> None:
+    """Attach a subcommand group to the root app (once)."""
+    if any(group.name == name for group in app.registered_groups):
+        return
+    app.add_typer(_load_group(name), name=name)
 
 
 def main() -> None:
-    """CLI entry point."""
+    """
+    CLI entry point.
+
+    A subcommand group named in the first argument is imported and invoked
+    directly, without going through the root app. Root-level help (no
+    arguments or an option such as `--help`) registers all groups so they
+    are listed.
+    """
+    first_arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if first_arg in _SUBCOMMAND_GROUPS:
+        group_app = _load_group(first_arg)
+        group_app(args=sys.argv[2:], prog_name=f"tinybase {first_arg}")
+        return
+
+    if first_arg is None or first_arg.startswith("-"):
+        for name in _SUBCOMMAND_GROUPS:
+            _register_group(name)
+
     app()
 
 
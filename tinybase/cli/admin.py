@@ -5,10 +5,13 @@ from uuid import UUID
 
 import typer
 
+from .utils import ensure_db, upsert_admin
+
 # Create admin subcommand group
 admin_app = typer.Typer(
     name="admin",
     help="Admin user management commands",
+    add_completion=False,
 )
 
 
@@ -23,35 +26,11 @@ def admin_add(
     Creates a new admin user with the given email and password.
     If the user already exists, updates their password and grants admin privileges.
     """
-    from sqlmodel import Session, select
-
-    from tinybase.auth import hash_password
-    from tinybase.db.core import create_db_and_tables, get_engine
-    from tinybase.db.models import User
-
     # Ensure database exists
-    create_db_and_tables()
+    engine = ensure_db()
 
-    engine = get_engine()
-    with Session(engine) as session:
-        # Check if user already exists
-        existing = session.exec(select(User).where(User.email == email)).first()
-
-        if existing:
-            existing.password_hash = hash_password(password)
-            existing.is_admin = True
-            session.add(existing)
-            session.commit()
-            typer.echo(f"Updated admin user: {email}")
-        else:
-            user = User(
-                email=email,
-                password_hash=hash_password(password),
-                is_admin=True,
-            )
-            session.add(user)
-            session.commit()
-            typer.echo(f"Created admin user: {email}")
+    action = upsert_admin(engine, email, password)
+    typer.echo(f"{action.capitalize()} admin user: {email}")
 
 
 @admin_app.command("token")
@@ -81,14 +60,11 @@ def admin_token(
     from sqlmodel import Session, select
 
     from tinybase.auth import create_application_token, revoke_application_token
-    from tinybase.db.core import create_db_and_tables, get_engine
     from tinybase.db.models import ApplicationToken
     from tinybase.utils import utcnow
 
     # Ensure database exists
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
         if action == "create":
             if not name:
@@ -1,16 +1,31 @@
 """Database management CLI commands."""
 
-from typing import Annotated, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 
+from .utils import ensure_db
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
 # Create db subcommand group
 db_app = typer.Typer(
     name="db",
     help="Database management commands",
+    add_completion=False,
 )
 
 
+@lru_cache(maxsize=1)
+def _alembic_cfg() -> "Config":
+    """Load alembic.ini once per process."""
+    from alembic.config import Config
+
+    return Config("alembic.ini")
+
+
 @db_app.command("migrate")
 def db_migrate(
     message: Annotated[
@@ -27,21 +42,18 @@ def db_migrate(
     to avoid foreign key reflection issues.
     """
     from alembic import command
-    from alembic.config import Config
 
     # Ensure all tables exist before autogenerate
     # This prevents errors when reflecting tables with foreign keys
     # to tables that don't exist yet
-    from tinybase.db.core import create_db_and_tables
-
     try:
-        create_db_and_tables()
+        ensure_db()
     except Exception as e:
         # If tables already exist or there's an issue, continue anyway
         # The autogenerate will handle the comparison
         typer.echo(f"Note: {e}")
 
-    alembic_cfg = Config("alembic.ini")
+    alembic_cfg = _alembic_cfg()
 
     if message:
         command.revision(alembic_cfg, message=message, autogenerate=True)
@@ -61,9 +73,8 @@ def db_upgrade(
     Upgrades the database to the specified revision (default: latest).
     """
     from alembic import command
-    from alembic.config import Config
 
-    alembic_cfg = Config("alembic.ini")
+    alembic_cfg = _alembic_cfg()
     command.upgrade(alembic_cfg, revision)
     typer.echo(f"Database upgraded to {revision}")
 
@@ -79,9 +90,8 @@ def db_downgrade(
     Use "-1" to go back one revision.
     """
     from alembic import command
-    from alembic.config import Config
 
-    alembic_cfg = Config("alembic.ini")
+    alembic_cfg = _alembic_cfg()
     command.downgrade(alembic_cfg, revision)
     typer.echo(f"Database downgraded to {revision}")
 
@@ -94,9 +104,8 @@ def db_history() -> None:
     Lists all migrations and their status.
     """
     from alembic import command
-    from alembic.config import Config
 
-    alembic_cfg = Config("alembic.ini")
+    alembic_cfg = _alembic_cfg()
     command.history(alembic_cfg)
 
 
@@ -106,7 +115,6 @@ def db_current() -> None:
     Show current database revision.
     """
     from alembic import command
-    from alembic.config import Config
 
-    alembic_cfg = Config("alembic.ini")
+    alembic_cfg = _alembic_cfg()
     command.current(alembic_cfg)
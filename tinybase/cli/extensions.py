@@ -1,16 +1,42 @@
 """Extension management CLI commands."""
 
-from typing import Annotated, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 
+from .utils import ensure_db
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+    from sqlmodel.sql.expression import SelectOfScalar
+
+    from tinybase.db.models import Extension
+
 # Create extensions subcommand group
 extensions_app = typer.Typer(
     name="extensions",
     help="Extension management commands",
+    add_completion=False,
 )
 
 
+@lru_cache(maxsize=1)
+def _extension_by_name_stmt() -> "SelectOfScalar[Extension]":
+    """Build the extension-by-name query once, with the name as a bound parameter."""
+    from sqlalchemy import bindparam
+    from sqlmodel import select
+
+    from tinybase.db.models import Extension
+
+    return select(Extension).where(Extension.name == bindparam("name"))
+
+
+def _get_extension(session: "Session", name: str) -> "Extension | None":
+    """Look up an installed extension by name."""
+    return session.exec(_extension_by_name_stmt(), params={"name": name}).first()
+
+
 @extensions_app.command("install")
 def extensions_install(
     url: Annotated[
@@ -26,7 +52,6 @@ def extensions_install(
     """
     from sqlmodel import Session
 
-    from tinybase.db.core import create_db_and_tables, get_engine
     from tinybase.extensions import InstallError, install_extension
 
     # Security warning
@@ -41,9 +66,7 @@ def extensions_install(
             raise typer.Exit(0)
 
     # Ensure database exists
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
         try:
             typer.echo(f"Installing extension from: {url}")
@@ -71,7 +94,6 @@ def extensions_uninstall(
     """
     from sqlmodel import Session
 
-    from tinybase.db.core import create_db_and_tables, get_engine
     from tinybase.extensions import uninstall_extension
 
     if not yes:
@@ -80,9 +102,7 @@ def extensions_uninstall(
             typer.echo("Uninstallation cancelled.")
             raise typer.Exit(0)
 
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
         if uninstall_extension(session, name):
             typer.echo(f"✓ Uninstalled extension: {name}")
@@ -102,12 +122,9 @@ def extensions_list() -> None:
     """
     from sqlmodel import Session, select
 
-    from tinybase.db.core import create_db_and_tables, get_engine
     from tinybase.db.models import Extension
 
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
         extensions = session.exec(select(Extension)).all()
 
@@ -118,20 +135,19 @@ def extensions_list() -> None:
             typer.echo("  tinybase extensions install <github-url>")
             return
 
-        typer.echo("")
-        typer.echo("Installed Extensions:")
-        typer.echo("-" * 60)
+        lines = ["", "Installed Extensions:", "-" * 60]
 
         for ext in extensions:
             status = "✓ enabled" if ext.is_enabled else "○ disabled"
-            typer.echo(f"\n  {ext.name} v{ext.version}  [{status}]")
+            lines.append(f"\n  {ext.name} v{ext.version}  [{status}]")
             if ext.description:
-                typer.echo(f"    {ext.description}")
+                lines.append(f"    {ext.description}")
             if ext.author:
-                typer.echo(f"    Author: {ext.author}")
-            typer.echo(f"    Source: {ext.repo_url}")
+                lines.append(f"    Author: {ext.author}")
+            lines.append(f"    Source: {ext.repo_url}")
 
-        typer.echo("")
+        lines.append("")
+        typer.echo("\n".join(lines))
 
 
 @extensions_app.command("enable")
@@ -143,17 +159,13 @@ def extensions_enable(
 
     The extension will be loaded on the next server restart.
     """
-    from sqlmodel import Session, select
+    from sqlmodel import Session
 
-    from tinybase.db.core import create_db_and_tables, get_engine
-    from tinybase.db.models import Extension
     from tinybase.utils import utcnow
 
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
-        extension = session.exec(select(Extension).where(Extension.name == name)).first()
+        extension = _get_extension(session, name)
 
         if not extension:
             typer.echo(f"Error: Extension '{name}' not found.", err=True)
@@ -182,17 +194,13 @@ def extensions_disable(
 
     The extension will not be loaded on the next server restart.
     """
-    from sqlmodel import Session, select
+    from sqlmodel import Session
 
-    from tinybase.db.core import create_db_and_tables, get_engine
-    from tinybase.db.models import Extension
     from tinybase.utils import utcnow
 
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
-        extension = session.exec(select(Extension).where(Extension.name == name)).first()
+        extension = _get_extension(session, name)
 
         if not extension:
             typer.echo(f"Error: Extension '{name}' not found.", err=True)
@@ -225,21 +233,19 @@ def extensions_check_updates(
     """
     from sqlmodel import Session, select
 
-    from tinybase.db.core import create_db_and_tables, get_engine
     from tinybase.db.models import Extension
     from tinybase.extensions import check_for_updates
 
-    create_db_and_tables()
-
-    engine = get_engine()
+    engine = ensure_db()
     with Session(engine) as session:
+        extensions = list(session.exec(select(Extension)).all())
+
         if name:
-            extensions = [session.exec(select(Extension).where(Extension.name == name)).first()]
-            if not extensions[0]:
+            by_name = {ext.name: ext for ext in extensions}
+            if name not in by_name:
                 typer.echo(f"Error: Extension '{name}' not found.", err=True)
                 raise typer.Exit(1)
-        else:
-            extensions = list(session.exec(select(Extension)).all())
+            extensions = [by_name[name]]
 
         if not extensions:
             typer.echo("No extensions installed.")
@@ -250,9 +256,7 @@ def extensions_check_updates(
 
         updates_available = False
         for ext in extensions:
-            if not ext:
-                continue
-            result = check_for_updates(session, ext.name)
+            result = check_for_updates(ext)
             if result:
                 current, latest = result
                 typer.echo(f"  {ext.name}: {current} → {latest} (update available)")
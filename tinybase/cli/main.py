@@ -6,10 +6,9 @@ from typing import Annotated, Optional
 
 import typer
 
-from tinybase.config import settings
 from tinybase.version import __version__
 
-from .utils import create_default_toml, get_example_functions
+from .utils import create_default_toml, ensure_db, get_example_functions, upsert_admin
 
 # Create main app
 app = typer.Typer(
@@ -46,23 +45,31 @@ def init(
     # Ensure directory exists
     directory = directory.resolve()
     directory.mkdir(parents=True, exist_ok=True)
-    os.chdir(directory)
 
-    typer.echo(f"Initializing TinyBase in {directory}")
+    from tinybase.config import reload_settings
+    from tinybase.db.core import reset_engine
+
+    # Resolve config and database paths against the target directory, dropping
+    # settings and an engine that were already loaded for another root
+    os.environ["TINYBASE_ROOT"] = str(directory)
+    reload_settings()
+    reset_engine()
+
+    status = [f"Initializing TinyBase in {directory}"]
 
     # Create tinybase.toml if missing
     toml_path = directory / "tinybase.toml"
     if not toml_path.exists():
         toml_path.write_text(create_default_toml())
-        typer.echo("  Created tinybase.toml")
+        status.append("  Created tinybase.toml")
     else:
-        typer.echo("  tinybase.toml already exists")
+        status.append("  tinybase.toml already exists")
 
     # Create functions directory and example functions if missing
     functions_dir = directory / "functions"
     if not functions_dir.exists():
         functions_dir.mkdir()
-        typer.echo("  Created functions/ directory")
+        status.append("  Created functions/ directory")
 
     # Create __init__.py if missing
     init_file = functions_dir / "__init__.py"
@@ -75,64 +82,43 @@ def init(
             "Each function file can use uv's single-file script feature to define inline dependencies.\n"
             '"""\n'
         )
-        typer.echo("  Created functions/__init__.py")
+        status.append("  Created functions/__init__.py")
 
     # Create example functions if they don't exist
-    example_functions = get_example_functions()
-
-    for filename, content in example_functions:
+    created_examples = False
+    for filename, content in get_example_functions():
         func_file = functions_dir / filename
         if not func_file.exists():
             func_file.write_text(content)
+            created_examples = True
 
-    if any(not (functions_dir / name).exists() for name, _ in example_functions):
-        typer.echo("  Created example functions in functions/ directory")
+    if created_examples:
+        status.append("  Created example functions in functions/ directory")
 
-    # Initialize database
-    typer.echo("  Initializing database...")
-    from tinybase.db.core import create_db_and_tables
+    # Report file setup before the (slower) database step
+    status.append("  Initializing database...")
+    typer.echo("\n".join(status))
 
-    create_db_and_tables()
-    typer.echo("  Database initialized")
+    # Initialize database
+    engine = ensure_db()
+    status = ["  Database initialized"]
 
     # Create admin user if credentials provided
     admin_email = admin_email or os.environ.get("TINYBASE_ADMIN_EMAIL")
     admin_password = admin_password or os.environ.get("TINYBASE_ADMIN_PASSWORD")
 
     if admin_email and admin_password:
-        from sqlmodel import Session, select
-
-        from tinybase.auth import hash_password
-        from tinybase.db.core import get_engine
-        from tinybase.db.models import User
-
-        engine = get_engine()
-        with Session(engine) as session:
-            # Check if admin already exists
-            existing = session.exec(select(User).where(User.email == admin_email)).first()
-
-            if existing:
-                # Update password and ensure admin flag is set
-                existing.password_hash = hash_password(admin_password)
-                existing.is_admin = True
-                session.add(existing)
-                session.commit()
-                typer.echo(f"  Updated admin user: {admin_email}")
-            else:
-                user = User(
-                    email=admin_email,
-                    password_hash=hash_password(admin_password),
-                    is_admin=True,
-                )
-                session.add(user)
-                session.commit()
-                typer.echo(f"  Created admin user: {admin_email}")
+        action = upsert_admin(engine, admin_email, admin_password)
+        status.append(f"  {action.capitalize()} admin user: {admin_email}")
     else:
-        typer.echo("  Tip: Run 'tinybase admin add <email> <password>' to create an admin user")
+        status.append("  Tip: Run 'tinybase admin add <email> <password>' to create an admin user")
 
-    typer.echo("")
-    typer.echo("TinyBase initialized successfully!")
-    typer.echo("Run 'tinybase serve' to start the server.")
+    status += [
+        "",
+        "TinyBase initialized successfully!",
+        "Run 'tinybase serve' to start the server.",
+    ]
+    typer.echo("\n".join(status))
 
 
 @app.command()
@@ -150,6 +136,8 @@ def serve(
     """
     import uvicorn
 
+    from tinybase.config import settings
+
     config = settings()
 
     # Use CLI options or fall back to config
@@ -161,8 +149,14 @@ def serve(
     typer.echo(f"  Admin UI: http://{bind_host}:{bind_port}/admin")
     typer.echo("")
 
+    # Reload mode needs an import string; otherwise pass the factory directly
+    if reload:
+        app_factory = "tinybase.api.app:create_app"
+    else:
+        from tinybase.api.app import create_app as app_factory
+
     uvicorn.run(
-        "tinybase.api.app:create_app",
+        app_factory,
         host=bind_host,
         port=bind_port,
         reload=reload,
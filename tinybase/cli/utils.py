@@ -1,14 +1,21 @@
 """Shared utility functions for CLI commands."""
 
+import re
+from functools import lru_cache
+from string import Template
+from typing import TYPE_CHECKING
 
-def snake_to_camel(name: str) -> str:
-    """Convert snake_case to CamelCase."""
-    return "".join(word.capitalize() for word in name.split("_"))
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
 
+# Matches the first character of each snake_case word (and the underscores before it)
+_SNAKE_RE = re.compile(r"(?:^|_+)([a-z0-9]?)")
 
-def create_default_toml() -> str:
-    """Generate default tinybase.toml content."""
-    return """# TinyBase Configuration
+# Engine that create_db_and_tables() last ran against in this process
+_initialized_engine: "Engine | None" = None
+
+# Default tinybase.toml written by `tinybase init`
+_DEFAULT_TOML = """# TinyBase Configuration
 # See documentation for all available options
 
 [server]
@@ -42,55 +49,51 @@ static_dir = "builtin"
 # api_token = "your-admin-token"
 """
 
-
-def create_function_boilerplate(name: str, description: str) -> str:
-    """Generate boilerplate code for a new function."""
-    camel_name = snake_to_camel(name)
-
-    return f'''"""
-{description}
+# Boilerplate for `tinybase functions new` (placeholders: name, camel_name, description)
+_FUNCTION_BOILERPLATE = Template(
+    '''"""
+${description}
 """
 
 from pydantic import BaseModel
 from tinybase.functions import Context, register
 
 
-class {camel_name}Input(BaseModel):
-    """Input model for {name} function."""
+class ${camel_name}Input(BaseModel):
+    """Input model for ${name} function."""
     # TODO: Define input fields
     pass
 
 
-class {camel_name}Output(BaseModel):
-    """Output model for {name} function."""
+class ${camel_name}Output(BaseModel):
+    """Output model for ${name} function."""
     # TODO: Define output fields
     pass
 
 
 @register(
-    name="{name}",
-    description="{description}",
+    name="${name}",
+    description="${description}",
     auth="auth",
-    input_model={camel_name}Input,
-    output_model={camel_name}Output,
+    input_model=${camel_name}Input,
+    output_model=${camel_name}Output,
     tags=[],
 )
-def {name}(ctx: Context, payload: {camel_name}Input) -> {camel_name}Output:
+def ${name}(ctx: Context, payload: ${camel_name}Input) -> ${camel_name}Output:
     """
-    {description}
+    ${description}
 
     TODO: Implement function logic
     """
-    return {camel_name}Output()
+    return ${camel_name}Output()
 '''
+)
 
-
-def get_example_functions() -> list[tuple[str, str]]:
-    """Get list of example function files to create during init."""
-    return [
-        (
-            "add_numbers.py",
-            '''"""
+# Example function files created by `tinybase init`: (filename, content)
+_EXAMPLE_FUNCTIONS: tuple[tuple[str, str], ...] = (
+    (
+        "add_numbers.py",
+        '''"""
 Add Numbers Function
 
 Example function demonstrating how to define a TinyBase function.
@@ -130,10 +133,10 @@ def add_numbers(ctx: Context, payload: AddInput) -> AddOutput:
     """
     return AddOutput(sum=payload.x + payload.y)
 ''',
-        ),
-        (
-            "hello.py",
-            '''"""
+    ),
+    (
+        "hello.py",
+        '''"""
 Hello World Function
 
 Example function demonstrating user context access.
@@ -173,10 +176,10 @@ def hello(ctx: Context, payload: HelloInput) -> HelloOutput:
         user_id=str(ctx.user_id) if ctx.user_id else None,
     )
 ''',
-        ),
-        (
-            "fetch_url.py",
-            '''# /// script
+    ),
+    (
+        "fetch_url.py",
+        '''# /// script
 # dependencies = [
 #   "requests>=2.32.0",
 # ]
@@ -265,5 +268,82 @@ def fetch_url(ctx: Context, payload: FetchUrlInput) -> FetchUrlOutput:
             error=str(e),
         )
 ''',
-        ),
-    ]
+    ),
+)
+
+
+@lru_cache(maxsize=256)
+def snake_to_camel(name: str) -> str:
+    """Convert snake_case to CamelCase."""
+    return _SNAKE_RE.sub(lambda m: m.group(1).upper(), name)
+
+
+def ensure_db() -> "Engine":
+    """
+    Create database tables once per engine and return the engine.
+
+    The returned engine (and its connection pool) is shared with the caller,
+    so follow-up sessions reuse the connection opened for table creation.
+    Tables are created again if the engine was reset since the last call.
+    """
+    global _initialized_engine
+
+    from tinybase.db.core import create_db_and_tables, get_engine
+
+    engine = get_engine()
+    if _initialized_engine is not engine:
+        create_db_and_tables()
+        _initialized_engine = engine
+
+    return engine
+
+
+def upsert_admin(engine: "Engine", email: str, password: str) -> str:
+    """
+    Create an admin user or update an existing user's password and admin flag.
+
+    Uses a single SQLite INSERT ... ON CONFLICT statement keyed on the email.
+
+    Returns:
+        "created" if a new user was inserted, "updated" otherwise.
+    """
+    from sqlalchemy.dialects.sqlite import insert
+    from sqlmodel import Session
+
+    from tinybase.auth import hash_password
+    from tinybase.db.models import User
+    from tinybase.utils import utcnow
+
+    user = User(email=email, password_hash=hash_password(password), is_admin=True)
+    stmt = (
+        insert(User)
+        .values(**user.model_dump())
+        .on_conflict_do_update(
+            index_elements=[User.email],
+            set_={"password_hash": user.password_hash, "is_admin": True, "updated_at": utcnow()},
+        )
+        .returning(User.id)
+    )
+
+    with Session(engine) as session:
+        user_id = session.exec(stmt).scalar_one()
+        session.commit()
+
+    return "created" if user_id == user.id else "updated"
+
+
+def create_default_toml() -> str:
+    """Generate default tinybase.toml content."""
+    return _DEFAULT_TOML
+
+
+def create_function_boilerplate(name: str, description: str) -> str:
+    """Generate boilerplate code for a new function."""
+    return _FUNCTION_BOILERPLATE.substitute(
+        name=name, camel_name=snake_to_camel(name), description=description
+    )
+
+
+def get_example_functions() -> list[tuple[str, str]]:
+    """Get list of example function files to create during init."""
+    return list(_EXAMPLE_FUNCTIONS)
@@ -3,10 +3,15 @@ Configuration management for TinyBase.
 
 Configuration is loaded from (in order of precedence):
 1. Environment variables (TINYBASE_*)
-2. tinybase.toml in the current working directory
+2. tinybase.toml in the project root directory
 3. Built-in defaults
+
+The project root is the current working directory unless TINYBASE_ROOT is
+set, in which case relative file paths in the configuration are resolved
+against it.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -21,19 +26,33 @@ else:
     import tomli as tomllib
 
 
+def get_root_dir() -> Path:
+    """Return the project root directory (TINYBASE_ROOT or the current directory)."""
+    root = os.environ.get("TINYBASE_ROOT")
+    return Path(root) if root else Path.cwd()
+
+
+def _resolve_root_path(path: str) -> str:
+    """Resolve a relative path against TINYBASE_ROOT, if set."""
+    root = os.environ.get("TINYBASE_ROOT")
+    if not root or Path(path).is_absolute():
+        return path
+    return str(Path(root) / path)
+
+
 def load_toml_config(toml_path: Path | None = None) -> dict[str, Any]:
     """
     Load configuration from tinybase.toml file.
 
     Args:
         toml_path: Optional explicit path to TOML file.
-                   If None, looks for tinybase.toml in current directory.
+                   If None, looks for tinybase.toml in the project root directory.
 
     Returns:
         Dictionary of configuration values (flattened for Pydantic settings).
     """
     if toml_path is None:
-        toml_path = Path.cwd() / "tinybase.toml"
+        toml_path = get_root_dir() / "tinybase.toml"
 
     if not toml_path.exists():
         return {}
@@ -151,6 +170,21 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level must be one of {valid_levels}")
         return v.lower()
 
+    @field_validator("db_url")
+    @classmethod
+    def resolve_sqlite_path(cls, v: str) -> str:
+        """Resolve relative SQLite database paths against TINYBASE_ROOT."""
+        prefix = "sqlite:///"
+        if not v.startswith(prefix) or v == f"{prefix}:memory:":
+            return v
+        return prefix + _resolve_root_path(v.removeprefix(prefix))
+
+    @field_validator("functions_path")
+    @classmethod
+    def resolve_functions_path(cls, v: str) -> str:
+        """Resolve a relative functions path against TINYBASE_ROOT."""
+        return _resolve_root_path(v)
+
     @field_validator("cors_allow_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v: Any) -> list[str]:
@@ -46,6 +46,9 @@ Usage for extension developers:
         return MyOutput(...)
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from tinybase.extensions.hooks import (
     FunctionCallEvent,
     FunctionCompleteEvent,
@@ -67,6 +70,7 @@ from tinybase.extensions.hooks import (
     on_shutdown,
     # Lifecycle hooks
     on_startup,
+    on_startup_background,
     # Authentication hooks
     on_user_login,
     on_user_register,
@@ -80,25 +84,61 @@ from tinybase.extensions.hooks import (
     run_user_login_hooks,
     run_user_register_hooks,
 )
-from tinybase.extensions.installer import (
-    ExtensionManifest,
-    InstallError,
-    check_for_updates,
-    install_extension,
-    parse_github_url,
-    uninstall_extension,
-    validate_manifest,
-)
-from tinybase.extensions.loader import (
-    get_extensions_directory,
-    load_enabled_extensions,
-    load_extension_module,
-    unload_extension,
-)
+
+if TYPE_CHECKING:
+    from tinybase.extensions.installer import (
+        ExtensionManifest,
+        InstallError,
+        check_for_updates,
+        install_extension,
+        parse_github_url,
+        uninstall_extension,
+        validate_manifest,
+    )
+    from tinybase.extensions.loader import (
+        get_extensions_directory,
+        load_enabled_extensions,
+        load_extension_module,
+        unload_extension,
+    )
+
+# Installer and loader names are imported on first access (PEP 562), so
+# extensions that only use the hook decorators don't load those modules.
+_LAZY_IMPORTS: dict[str, str] = {
+    "ExtensionManifest": "tinybase.extensions.installer",
+    "InstallError": "tinybase.extensions.installer",
+    "check_for_updates": "tinybase.extensions.installer",
+    "install_extension": "tinybase.extensions.installer",
+    "parse_github_url": "tinybase.extensions.installer",
+    "uninstall_extension": "tinybase.extensions.installer",
+    "validate_manifest": "tinybase.extensions.installer",
+    "get_extensions_directory": "tinybase.extensions.loader",
+    "load_enabled_extensions": "tinybase.extensions.loader",
+    "load_extension_module": "tinybase.extensions.loader",
+    "unload_extension": "tinybase.extensions.loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import installer and loader names lazily."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = [
     # Lifecycle hooks (for extension developers)
     "on_startup",
+    "on_startup_background",
     "on_shutdown",
     # Authentication hooks
     "on_user_login",
@@ -5,6 +5,7 @@ Provides decorators and a registry for extension events:
 
 Lifecycle hooks:
 - on_startup: Called when TinyBase starts
+- on_startup_background: Started in the background when TinyBase starts
 - on_shutdown: Called when TinyBase shuts down
 
 Authentication hooks:
@@ -21,9 +22,12 @@ Function hooks:
 - on_function_complete: Called after a function completes
 """
 
+import asyncio
+import inspect
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Hashable
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
@@ -128,12 +132,107 @@ class HookRegistry:
 
     def clear(self) -> None:
         """Clear all registered hooks."""
-        self.hooks = []
+        self.hooks.clear()
+
+
+def _hook_key(func: Callable) -> Hashable:
+    """
+    Get the identity of a hook for duplicate detection.
+
+    Module-level functions are keyed by module and qualified name, so a
+    re-imported module's new function objects match the old ones. Bound
+    methods are keyed by instance and function, so methods of different
+    instances don't collide. Lambdas, nested functions and other callables
+    are keyed by object identity.
+    """
+    if inspect.ismethod(func):
+        return (id(func.__self__), func.__func__)
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+    if module and qualname and "<" not in qualname and _hook_globals(func) is not None:
+        return (module, qualname)
+    return id(func)
+
+
+def _hook_globals(func: Callable) -> dict[str, Any] | None:
+    """Get the module namespace a hook was defined in (looking through decorators)."""
+    return getattr(inspect.unwrap(func), "__globals__", None)
+
+
+@dataclass
+class LifecycleHookRegistry:
+    """
+    Registry for lifecycle hooks, classified when they are registered.
+
+    Sync hooks run in a worker thread unless registered as non-blocking, in
+    which case they run directly on the event loop. Each hook is stored at
+    most once; registering a new version of a hook from a re-executed module
+    (e.g. after a reload) replaces the previous one. Distinct hooks that share
+    a name within one module execution are all kept.
+    """
+
+    inline_hooks: deque[Callable[[], None]] = field(default_factory=deque)
+    thread_hooks: deque[Callable[[], None]] = field(default_factory=deque)
+    async_hooks: deque[Callable[[], Awaitable[None]]] = field(default_factory=deque)
+    # Registered hooks by _hook_key, used to skip or replace duplicates
+    registered: dict[Hashable, list[Callable]] = field(default_factory=dict)
+    # Frozen (inline, thread, async) snapshot used by the runner; reset on registration
+    frozen: tuple[tuple[Callable, ...], ...] | None = None
+
+    def register(self, func: Callable, blocking: bool = True) -> None:
+        """Register a hook function in the queue matching how it must be run."""
+        same_key = self.registered.setdefault(_hook_key(func), [])
+        if func in same_key:
+            return
+
+        func_globals = _hook_globals(func)
+        for previous in tuple(same_key):
+            if _hook_globals(previous) is not func_globals:
+                logger.info("Replacing hook %s with its reloaded version", _hook_name(func))
+                same_key.remove(previous)
+                self._remove(previous)
+        same_key.append(func)
+
+        if _is_async_hook(func):
+            self.async_hooks.append(func)
+        elif blocking:
+            self.thread_hooks.append(func)
+        else:
+            self.inline_hooks.append(func)
+        self.frozen = None
+
+    def _remove(self, func: Callable) -> None:
+        """Remove a hook function from whichever queue holds it."""
+        for hooks in (self.inline_hooks, self.thread_hooks, self.async_hooks):
+            if func in hooks:
+                hooks.remove(func)
+                return
+
+    def snapshot(self) -> tuple[tuple[Callable, ...], ...]:
+        """Get the (inline, thread, async) hooks as tuples, rebuilt only after changes."""
+        if self.frozen is None:
+            self.frozen = (
+                tuple(self.inline_hooks),
+                tuple(self.thread_hooks),
+                tuple(self.async_hooks),
+            )
+        return self.frozen
+
+    def clear(self) -> None:
+        """Clear all registered hooks."""
+        self.inline_hooks.clear()
+        self.thread_hooks.clear()
+        self.async_hooks.clear()
+        self.registered.clear()
+        self.frozen = None
 
 
 # Global registries
-_startup_hooks: list[Callable[[], None]] = []
-_shutdown_hooks: list[Callable[[], None]] = []
+_startup_hooks = LifecycleHookRegistry()
+_shutdown_hooks = LifecycleHookRegistry()
+_startup_background_hooks = LifecycleHookRegistry()
+# Running background startup tasks (strong references keep them from being garbage collected)
+_background_tasks: set[asyncio.Task] = set()
 _user_login_hooks = HookRegistry()
 _user_register_hooks = HookRegistry()
 _record_create_hooks = HookRegistry()
@@ -148,12 +247,37 @@ _function_complete_hooks = HookRegistry()
 # =============================================================================
 
 
-def on_startup(func: Callable[[], None]) -> Callable[[], None]:
+def _is_async_hook(func: Callable) -> bool:
+    """
+    Check whether a hook returns an awaitable and must be awaited.
+
+    Looks through functools.wraps-style decorators, so a sync wrapper around
+    an async function is classified as async, and treats objects with an
+    async __call__ method as async. Other callables can still return an
+    awaitable; the runners check their results as well.
+    """
+    return (
+        inspect.iscoroutinefunction(func)
+        or inspect.iscoroutinefunction(inspect.unwrap(func))
+        or inspect.iscoroutinefunction(getattr(func, "__call__", None))
+    )
+
+
+def on_startup(
+    func: Callable[[], None] | None = None, *, blocking: bool = True
+) -> Callable[..., Any]:
     """
     Decorator to register a function to run on TinyBase startup.
 
     The decorated function will be called after all extensions are loaded,
-    before the server starts accepting requests.
+    before the server starts accepting requests. Startup hooks run
+    concurrently; sync functions run in a worker thread so blocking I/O
+    doesn't stall the event loop.
+
+    Args:
+        blocking: Set to False for quick, CPU-light sync hooks. They then run
+            directly on the event loop, in registration order, before the
+            other hooks (ignored for async hooks).
 
     Example:
         from tinybase.extensions import on_startup
@@ -161,17 +285,54 @@ def on_startup(func: Callable[[], None]) -> Callable[[], None]:
         @on_startup
         def initialize_my_extension():
             print("Extension initialized!")
+
+        @on_startup(blocking=False)
+        def register_defaults():
+            DEFAULTS["theme"] = "dark"
+    """
+
+    def decorator(func: Callable[[], None]) -> Callable[[], None]:
+        _startup_hooks.register(func, blocking)
+        return func
+
+    return decorator if func is None else decorator(func)
+
+
+def on_startup_background(func: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Decorator to register a function to run in the background on TinyBase startup.
+
+    Unlike on_startup, the server does not wait for these hooks. They are
+    started after the regular startup hooks have finished; sync functions
+    run in a worker thread. Async hooks still running at shutdown are
+    cancelled. Sync hooks cannot be cancelled: the worker thread keeps
+    running and delays process exit until the function returns.
+
+    Example:
+        from tinybase.extensions import on_startup_background
+
+        @on_startup_background
+        async def warm_cache():
+            await load_remote_data()
     """
-    _startup_hooks.append(func)
+    _startup_background_hooks.register(func)
     return func
 
 
-def on_shutdown(func: Callable[[], None]) -> Callable[[], None]:
+def on_shutdown(
+    func: Callable[[], None] | None = None, *, blocking: bool = True
+) -> Callable[..., Any]:
     """
     Decorator to register a function to run on TinyBase shutdown.
 
     The decorated function will be called when the server is shutting down,
-    before the process exits.
+    before the process exits. Shutdown hooks run concurrently; sync functions
+    run in a worker thread so blocking I/O doesn't stall the event loop.
+
+    Args:
+        blocking: Set to False for quick, CPU-light sync hooks. They then run
+            directly on the event loop, in registration order, before the
+            other hooks (ignored for async hooks).
 
     Example:
         from tinybase.extensions import on_shutdown
@@ -180,8 +341,12 @@ def on_shutdown(func: Callable[[], None]) -> Callable[[], None]:
         def cleanup_my_extension():
             print("Extension shutting down!")
     """
-    _shutdown_hooks.append(func)
-    return func
+
+    def decorator(func: Callable[[], None]) -> Callable[[], None]:
+        _shutdown_hooks.register(func, blocking)
+        return func
+
+    return decorator if func is None else decorator(func)
 
 
 # =============================================================================
@@ -386,29 +551,121 @@ def on_function_complete(
 # =============================================================================
 
 
-async def _run_hooks(hooks: list[Callable], event: Any = None) -> None:
-    """Execute a list of hooks with optional event data."""
+def _hook_name(hook: Callable) -> str:
+    """Get a hook's name for log messages, falling back to repr() (e.g. for partials)."""
+    return getattr(hook, "__name__", None) or repr(hook)
+
+
+def _call_safe(kind: str, hook: Callable, *args: Any) -> Any:
+    """Call a hook and return its result, logging any exception (returns None)."""
+    try:
+        return hook(*args)
+    except Exception:
+        logger.exception("Error in %s hook %s", kind, _hook_name(hook))
+        return None
+
+
+async def _await_safe(kind: str, hook: Callable, awaitable: Awaitable[Any]) -> None:
+    """Await the result of an async hook, logging any exception."""
+    try:
+        await awaitable
+    except Exception:
+        logger.exception("Error in %s hook %s", kind, _hook_name(hook))
+
+
+async def _await_hooks(pending: list[tuple[Callable, Awaitable[Any]]], kind: str) -> None:
+    """
+    Await the results of async hooks concurrently in a task group.
+
+    Each task logs its own failure, so one failing hook never cancels the
+    others.
+    """
+    if not pending:
+        return
+
+    async with asyncio.TaskGroup() as tg:
+        for hook, awaitable in pending:
+            tg.create_task(_await_safe(kind, hook, awaitable))
+
+
+async def _run_hooks(hooks: list[Callable], event: Any = None, kind: str = "event") -> None:
+    """
+    Execute a list of hooks with optional event data.
+
+    Hooks are called in order; awaitables returned by async hooks are then
+    awaited concurrently.
+    """
+    args = () if event is None else (event,)
+    pending: list[tuple[Callable, Awaitable[Any]]] = []
     for hook in hooks:
-        try:
-            if event is not None:
-                result = hook(event)
-            else:
-                result = hook()
-            # Handle async hooks
-            if hasattr(result, "__await__"):
-                await result
-        except Exception as e:
-            logger.error(f"Error in hook {hook.__name__}: {e}")
+        result = _call_safe(kind, hook, *args)
+        # Handle async hooks (sync hooks usually return None, so skip the check)
+        if result is not None and inspect.isawaitable(result):
+            pending.append((hook, result))
+
+    await _await_hooks(pending, kind)
+
+
+async def _call_in_thread(hook: Callable[[], Any]) -> None:
+    """Run a sync hook in a worker thread, then await its result if it is awaitable."""
+    result = await asyncio.to_thread(hook)
+    if result is not None and inspect.isawaitable(result):
+        await result
+
+
+def _call_lifecycle_hooks(
+    kind: str, registry: LifecycleHookRegistry
+) -> list[tuple[Callable, Awaitable[Any]]]:
+    """
+    Run non-blocking sync hooks in order and start all other hooks.
+
+    Returns the awaitables of the started hooks: blocking sync hooks are
+    handed to worker threads, async hooks are called. Awaitables returned by
+    sync hooks (e.g. a lambda returning a coroutine) are included as well.
+    """
+    inline_hooks, thread_hooks, async_hooks = registry.snapshot()
+    pending: list[tuple[Callable, Awaitable[Any]]] = []
+    for hook in inline_hooks:
+        result = _call_safe(kind, hook)
+        if result is not None and inspect.isawaitable(result):
+            pending.append((hook, result))
+
+    pending += [(hook, _call_in_thread(hook)) for hook in thread_hooks]
+    for hook in async_hooks:
+        result = _call_safe(kind, hook)
+        if inspect.isawaitable(result):
+            pending.append((hook, result))
+    return pending
+
+
+async def _run_lifecycle_hooks(kind: str, registry: LifecycleHookRegistry) -> None:
+    """Run non-blocking sync hooks in order, then all other hooks concurrently."""
+    await _await_hooks(_call_lifecycle_hooks(kind, registry), kind)
+
+
+def _start_background_hooks() -> None:
+    """Schedule background startup hooks as tasks without awaiting them."""
+    for hook, awaitable in _call_lifecycle_hooks("background startup", _startup_background_hooks):
+        task = asyncio.create_task(_await_safe("background startup", hook, awaitable))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
 
 async def run_startup_hooks() -> None:
-    """Execute all registered startup hooks."""
-    await _run_hooks(_startup_hooks)
+    """Execute all registered startup hooks, then start the background ones."""
+    await _run_lifecycle_hooks("startup", _startup_hooks)
+    _start_background_hooks()
 
 
 async def run_shutdown_hooks() -> None:
-    """Execute all registered shutdown hooks."""
-    await _run_hooks(_shutdown_hooks)
+    """Cancel unfinished background startup hooks and execute all shutdown hooks."""
+    tasks = tuple(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    # Wait for the cancelled hooks to unwind (sync hooks' threads are not interrupted)
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    await _run_lifecycle_hooks("shutdown", _shutdown_hooks)
 
 
 async def run_user_login_hooks(event: UserLoginEvent) -> None:
@@ -460,9 +717,9 @@ async def run_function_complete_hooks(event: FunctionCompleteEvent) -> None:
 
 def clear_hooks() -> None:
     """Clear all registered hooks. Used for testing."""
-    global _startup_hooks, _shutdown_hooks
-    _startup_hooks = []
-    _shutdown_hooks = []
+    _startup_hooks.clear()
+    _shutdown_hooks.clear()
+    _startup_background_hooks.clear()
     _user_login_hooks.clear()
     _user_register_hooks.clear()
     _record_create_hooks.clear()
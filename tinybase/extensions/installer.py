@@ -199,10 +199,10 @@ def install_dependencies(extension_dir: Path) -> None:
     requirements_file = extension_dir / "requirements.txt"
 
     if not requirements_file.exists():
-        logger.debug(f"No requirements.txt found in {extension_dir}")
+        logger.debug("No requirements.txt found in %s", extension_dir)
         return
 
-    logger.info(f"Installing dependencies from {requirements_file}")
+    logger.info("Installing dependencies from %s", requirements_file)
 
     try:
         result = subprocess.run(
@@ -251,12 +251,12 @@ def install_extension(
     # Clone to temporary location first
     temp_dir = extensions_dir / f".temp_{repo}"
     try:
-        logger.info(f"Cloning repository: {git_url}")
+        logger.info("Cloning repository: %s", git_url)
         clone_repository(git_url, temp_dir, branch)
 
         # Validate manifest
         manifest = validate_manifest(temp_dir / "extension.toml")
-        logger.info(f"Found extension: {manifest.name} v{manifest.version}")
+        logger.info("Found extension: %s v%s", manifest.name, manifest.version)
 
         # Check if extension already installed
         existing = session.exec(select(Extension).where(Extension.name == manifest.name)).first()
@@ -297,7 +297,7 @@ def install_extension(
         # Load the extension
         load_extension_module(final_dir, manifest.entry_point)
 
-        logger.info(f"Successfully installed extension: {manifest.name}")
+        logger.info("Successfully installed extension: %s", manifest.name)
         return extension
 
     except Exception:
@@ -337,36 +337,26 @@ def uninstall_extension(session: "Session", name: str) -> bool:
     ext_dir = extensions_dir / extension.install_path
     if ext_dir.exists():
         shutil.rmtree(ext_dir)
-        logger.info(f"Removed extension files: {ext_dir}")
+        logger.info("Removed extension files: %s", ext_dir)
 
     # Remove database record
     session.delete(extension)
     session.commit()
 
-    logger.info(f"Uninstalled extension: {name}")
+    logger.info("Uninstalled extension: %s", name)
     return True
 
 
-def check_for_updates(session: "Session", name: str) -> tuple[str, str] | None:
+def check_for_updates(extension: "Extension") -> tuple[str, str] | None:
     """
     Check if an extension has updates available.
 
     Args:
-        session: Database session.
-        name: Extension name.
+        extension: Installed extension record.
 
     Returns:
         Tuple of (current_version, latest_version) if update available, None otherwise.
     """
-    from sqlmodel import select
-
-    from tinybase.db.models import Extension
-
-    extension = session.exec(select(Extension).where(Extension.name == name)).first()
-
-    if not extension:
-        return None
-
     # Parse the repo URL and fetch latest manifest
     try:
         owner, repo, _ = parse_github_url(extension.repo_url)
@@ -396,6 +386,6 @@ def check_for_updates(session: "Session", name: str) -> tuple[str, str] | None:
                     return (extension.version, latest_version)
 
     except Exception as e:
-        logger.debug(f"Failed to check for updates for {name}: {e}")
+        logger.debug("Failed to check for updates for %s: %s", extension.name, e)
 
     return None
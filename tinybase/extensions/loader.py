@@ -45,7 +45,7 @@ def load_extension_module(extension_path: Path, entry_point: str) -> bool:
     module_file = extension_path / entry_point
 
     if not module_file.exists():
-        logger.error(f"Extension entry point not found: {module_file}")
+        logger.error("Extension entry point not found: %s", module_file)
         return False
 
     # Create a unique module name
@@ -64,22 +64,22 @@ def load_extension_module(extension_path: Path, entry_point: str) -> bool:
         try:
             spec = importlib.util.spec_from_file_location(module_name, module_file)
             if spec is None or spec.loader is None:
-                logger.error(f"Failed to create module spec for {module_file}")
+                logger.error("Failed to create module spec for %s", module_file)
                 return False
 
             module = importlib.util.module_from_spec(spec)
             sys.modules[module_name] = module
             spec.loader.exec_module(module)
 
-            logger.info(f"Loaded extension module: {module_name}")
+            logger.info("Loaded extension module: %s", module_name)
             return True
         finally:
             # Remove from sys.path
             if ext_path_str in sys.path:
                 sys.path.remove(ext_path_str)
 
-    except Exception as e:
-        logger.error(f"Error loading extension from {extension_path}: {e}")
+    except Exception:
+        logger.exception("Error loading extension from %s", extension_path)
         return False
 
 
@@ -115,14 +115,14 @@ def load_enabled_extensions(session: "Session") -> int:
         ext_path = extensions_dir / ext.install_path
 
         if not ext_path.exists():
-            logger.warning(f"Extension directory not found: {ext_path}")
+            logger.warning("Extension directory not found: %s", ext_path)
             continue
 
         if load_extension_module(ext_path, ext.entry_point):
             loaded_count += 1
-            logger.info(f"Loaded extension: {ext.name} v{ext.version}")
+            logger.info("Loaded extension: %s v%s", ext.name, ext.version)
         else:
-            logger.error(f"Failed to load extension: {ext.name}")
+            logger.error("Failed to load extension: %s", ext.name)
 
     return loaded_count
 
@@ -144,7 +144,7 @@ def unload_extension(name: str) -> bool:
 
     if module_name in sys.modules:
         del sys.modules[module_name]
-        logger.info(f"Unloaded extension module: {module_name}")
+        logger.info("Unloaded extension module: %s", module_name)
         return True
 
     return False